@@ -0,0 +1,44 @@
+"""
+Memorización compartida de las simulaciones
+===========================================
+
+Decorador para los integradores de las páginas: guarda los resultados por
+parámetros (``functools.lru_cache``) y deja de solo lectura los arrays
+devueltos, ya que se comparten entre todas las llamadas que aciertan en
+la caché.
+
+El nombre empieza con guion bajo para que Dash no lo trate como página.
+"""
+
+from functools import lru_cache, wraps
+
+import numpy as np
+
+
+def memorizar_solo_lectura(maxsize: int = 128):
+    """
+    Memoriza una función que devuelve una tupla con arrays de NumPy.
+
+    Los arrays del resultado se marcan como no escribibles una sola vez,
+    al calcularse; los demás valores (p. ej. escalares) se devuelven tal
+    cual. Los argumentos deben ser hashables y conviene normalizarlos
+    (redondeo, ``int``) antes de llamar, para no fragmentar la caché.
+
+    Parámetros:
+        maxsize: número máximo de resultados guardados
+
+    Retorna:
+        decorador; la función decorada conserva ``cache_info`` y
+        ``cache_clear`` de ``lru_cache``
+    """
+    def decorador(funcion):
+        @lru_cache(maxsize=maxsize)
+        @wraps(funcion)
+        def envoltura(*args):
+            resultado = funcion(*args)
+            for valor in resultado:
+                if isinstance(valor, np.ndarray):
+                    valor.flags.writeable = False
+            return resultado
+        return envoltura
+    return decorador
@@ -0,0 +1,65 @@
+"""
+Plantilla Plotly compartida por las páginas del modelo SIR
+==========================================================
+
+Registra en ``plotly.io.templates`` una plantilla con el fondo, la tipografía,
+los ejes y la leyenda comunes a las gráficas SIR, de modo que cada callback
+solo indique los campos propios de su figura (título, rangos, márgenes).
+
+La plantilla se construye a partir de ``COLORES``, la paleta que también usan
+los estilos de la página SIR, para que los colores se definan en un solo lugar.
+
+El nombre empieza con guion bajo para que Dash no lo trate como página.
+"""
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Paleta de colores profesional
+COLORES = {
+    'primario': '#2C5AA0',          # Azul corporativo
+    'secundario': '#E74C3C',        # Rojo para énfasis
+    'exito': '#27AE60',             # Verde
+    'advertencia': '#F39C12',       # Naranja
+    'fondo_claro': '#ECEFF1',       # Gris muy claro
+    'fondo_oscuro': '#FFFFFF',      # Blanco puro
+    'texto_primario': '#2C3E50',    # Gris oscuro
+    'texto_secundario': '#7F8C8D',  # Gris medio
+    'borde': '#BDC3C7',             # Gris claro
+    'grid': '#ECF0F1',              # Grid tenue
+    
+    # Colores específicos para SIR
+    'susceptibles': '#3498DB',      # Azul claro (Susceptibles)
+    'infectados': '#E74C3C',        # Rojo (Infectados)
+    'recuperados': '#27AE60'        # Verde (Recuperados)
+}
+
+PLANTILLA_SIR = 'sir_portafolio'
+
+_ESTILO_EJE = dict(
+    showgrid=True,
+    gridwidth=1,
+    gridcolor=COLORES['grid'],
+    zeroline=False,
+    showline=True,
+    linewidth=1,
+    linecolor=COLORES['borde'],
+    mirror=False
+)
+
+if PLANTILLA_SIR not in pio.templates:
+    _plantilla = go.layout.Template(pio.templates['plotly_white'])
+    _plantilla.layout.update(
+        paper_bgcolor=COLORES['fondo_claro'],
+        plot_bgcolor=COLORES['fondo_oscuro'],
+        font=dict(color=COLORES['texto_primario'], size=12),
+        hovermode='x unified',
+        xaxis=_ESTILO_EJE,
+        yaxis=_ESTILO_EJE,
+        legend=dict(
+            bgcolor='rgba(255, 255, 255, 0.8)',
+            bordercolor=COLORES['borde'],
+            borderwidth=1
+        )
+    )
+    pio.templates[PLANTILLA_SIR] = _plantilla
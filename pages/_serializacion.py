@@ -0,0 +1,26 @@
+"""
+Utilidades de serialización compartidas por las páginas
+=======================================================
+
+Funciones para enviar series numéricas al navegador en el formato compacto
+que entiende plotly.js, cuando una figura se arma como ``dict`` en lugar de
+``go.Figure`` (y por tanto Plotly no codifica los arrays por su cuenta).
+
+El nombre empieza con guion bajo para que Dash no lo trate como página.
+"""
+
+import base64
+from typing import Dict
+
+import numpy as np
+
+
+def codificar_float32(arr: np.ndarray) -> Dict[str, str]:
+    """
+    Codifica un array como *typed array* de Plotly (float32 en base64).
+
+    plotly.js (incluido en Dash 3) acepta ``{'dtype': 'f4', 'bdata': ...}``
+    directamente en ``x``/``y``, lo que evita enviar cada número como texto.
+    """
+    datos = np.ascontiguousarray(arr, dtype='<f4').tobytes()
+    return {'dtype': 'f4', 'bdata': base64.b64encode(datos).decode('ascii')}
@@ -12,6 +12,8 @@ Autor: Equipo de Análisis
 Versión: 2.0 (Profesional)
 """
 
+from types import MappingProxyType
+
 import dash
 from dash import html, dcc, Input, Output, State, callback
 import plotly.graph_objects as go
@@ -37,8 +39,9 @@ dash.register_page(
 # CONSTANTES Y CONFIGURACIÓN
 # ==========================================
 
-# Paleta de colores profesional (coherente con diseño corporativo)
-COLORES = {
+# Paleta de colores profesional (coherente con diseño corporativo).
+# Se expone como mapeo de solo lectura para evitar mutaciones accidentales.
+COLORES = MappingProxyType({
     'primario': '#2C5AA0',        # Azul corporativo
     'secundario': '#E74C3C',      # Rojo para énfasis
     'exito': '#27AE60',           # Verde para validación
@@ -49,7 +52,7 @@ COLORES = {
     'texto_secundario': '#7F8C8D',# Gris medio
     'borde': '#BDC3C7',           # Gris claro
     'grid': '#ECF0F1'             # Grid tenue
-}
+})
 
 # Estilos reutilizables
 ESTILO_CONTENEDOR = {
@@ -95,8 +98,20 @@ ESTILO_BTN_PRIMARIO = {
     'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.1)'
 }
 
-# Rango de validación
-VALIDACION = {
+ESTILO_TARJETA_ETIQUETA = {
+    'margin': '0px',
+    'fontSize': '12px',
+    'color': COLORES['texto_secundario']
+}
+
+ESTILO_TARJETA_VALOR = {
+    'margin': '8px 0px 0px',
+    'fontSize': '20px',
+    'fontWeight': '600'
+}
+
+# Rango de validación (solo lectura)
+VALIDACION = MappingProxyType({
     'p0_min': 0,
     'p0_max': 1000000,
     'r_min': 0.001,
@@ -105,7 +120,7 @@ VALIDACION = {
     'k_max': 10000000,
     't_min': 1,
     't_max': 1000
-}
+})
 
 # ==========================================
 # FUNCIONES AUXILIARES
@@ -182,6 +197,14 @@ def calcular_poblacion_logistica(p0, r, k, t_max, puntos=300):
     return t, P
 
 
+def crear_tarjeta_estadistica(etiqueta, valor, color, fondo, **estilo_extra):
+    """Genera una tarjeta de estadística reutilizando los estilos base."""
+    return html.Div([
+        html.P(etiqueta, style=ESTILO_TARJETA_ETIQUETA),
+        html.P(valor, style={**ESTILO_TARJETA_VALOR, 'color': color})
+    ], style={'padding': '12px', 'backgroundColor': fondo, 'borderRadius': '6px', **estilo_extra})
+
+
 def generar_figura_error(mensaje):
     """Genera una figura de error con mensaje personalizado."""
     fig = go.Figure()
@@ -444,13 +467,21 @@ layout = html.Div([
     [State('input-p0', 'value'),
      State('input-r', 'value'),
      State('input-k', 'value'),
-     State('input-t', 'value')],
+     State('input-t', 'value'),
+     State('mensaje-validacion', 'style')],
     prevent_initial_call=False
 )
-def actualizar_simulacion(n_clicks, p0, r, k, t_max):
+def actualizar_simulacion(n_clicks, p0, r, k, t_max, estilo_mensaje):
     """
     Actualiza la simulación y gráfica basada en los parámetros ingresados.
+
+    Las salidas que no cambian respecto al estado actual del cliente se
+    devuelven como ``dash.no_update`` para evitar re-renderizados.
     """
+    # Estado visible del mensaje de validación (tras un error el panel
+    # de estadísticas ya quedó vacío)
+    mensaje_visible = (estilo_mensaje or {}).get('display') == 'block'
+
     # Validar parámetros
     es_valido, mensaje_error = validar_parametros(p0, r, k, t_max)
 
@@ -468,7 +499,8 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
             'fontSize': '13px'
         }
         
-        return fig_error, [], mensaje_error, estilo_error
+        estadisticas_error = dash.no_update if mensaje_visible else []
+        return fig_error, estadisticas_error, mensaje_error, estilo_error
 
     # Calcular dinámica poblacional
     try:
@@ -479,6 +511,13 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
         fig_error = generar_figura_error("Error en el cálculo de la simulación")
         return fig_error, [], "Error interno", {'display': 'none'}
 
+    # Colores usados repetidamente en la figura y las tarjetas
+    color_primario = COLORES['primario']
+    color_advertencia = COLORES['advertencia']
+    color_exito = COLORES['exito']
+    color_borde = COLORES['borde']
+    color_grid = COLORES['grid']
+
     # Crear trazos
     trace_poblacion = go.Scatter(
         x=t,
@@ -486,7 +525,7 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
         mode='lines',
         name='Población P(t)',
         line=dict(
-            color=COLORES['primario'],
+            color=color_primario,
             width=3
         ),
         fill='tozeroy',
@@ -500,7 +539,7 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
         mode='lines',
         name='Capacidad de Carga (K)',
         line=dict(
-            color=COLORES['advertencia'],
+            color=color_advertencia,
             width=2,
             dash='dash'
         ),
@@ -513,7 +552,7 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
     fig.update_layout(
         title={
             'text': '<b>Dinámica Poblacional - Modelo Logístico</b>',
-            'font': {'size': 18, 'color': COLORES['primario']},
+            'font': {'size': 18, 'color': color_primario},
             'x': 0.5,
             'xanchor': 'center'
         },
@@ -530,22 +569,22 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
         xaxis=dict(
             showgrid=True,
             gridwidth=1,
-            gridcolor=COLORES['grid'],
+            gridcolor=color_grid,
             zeroline=False,
             showline=True,
             linewidth=1,
-            linecolor=COLORES['borde'],
+            linecolor=color_borde,
             mirror=False,
             range=[0, t_max]
         ),
         yaxis=dict(
             showgrid=True,
             gridwidth=1,
-            gridcolor=COLORES['grid'],
+            gridcolor=color_grid,
             zeroline=False,
             showline=True,
             linewidth=1,
-            linecolor=COLORES['borde'],
+            linecolor=color_borde,
             mirror=False
         ),
 
@@ -557,7 +596,7 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
             xanchor='right',
             x=1.0,
             bgcolor='rgba(255, 255, 255, 0.8)',
-            bordercolor=COLORES['borde'],
+            bordercolor=color_borde,
             borderwidth=1
         ),
 
@@ -578,33 +617,24 @@ def actualizar_simulacion(n_clicks, p0, r, k, t_max):
 
     # Crear tarjetas de estadísticas
     estadisticas = [
-        html.Div([
-            html.P("Población Inicial", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{poblacion_inicial:.0f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['primario']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(44, 90, 160, 0.08)", 'borderRadius': '6px'}),
-
-        html.Div([
-            html.P("Población Final", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{poblacion_final:.0f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['primario']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(44, 90, 160, 0.08)", 'borderRadius': '6px'}),
-
-        html.Div([
-            html.P("Capacidad de Carga", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{k:.0f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['advertencia']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(243, 156, 18, 0.08)", 'borderRadius': '6px'}),
-
-        html.Div([
-            html.P("% de Capacidad Alcanzada", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{(poblacion_final / k * 100):.1f}%", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['exito']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(39, 174, 96, 0.08)", 'borderRadius': '6px'})
+        crear_tarjeta_estadistica("Población Inicial", f"{poblacion_inicial:.0f}",
+                                  color_primario, "rgba(44, 90, 160, 0.08)"),
+        crear_tarjeta_estadistica("Población Final", f"{poblacion_final:.0f}",
+                                  color_primario, "rgba(44, 90, 160, 0.08)"),
+        crear_tarjeta_estadistica("Capacidad de Carga", f"{k:.0f}",
+                                  color_advertencia, "rgba(243, 156, 18, 0.08)"),
+        crear_tarjeta_estadistica("% de Capacidad Alcanzada", f"{(poblacion_final / k * 100):.1f}%",
+                                  color_exito, "rgba(39, 174, 96, 0.08)")
     ]
 
     if tiempo_mitad_capacidad:
         estadisticas.append(
-            html.Div([
-                html.P("Tiempo a K/2", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-                html.P(f"{tiempo_mitad_capacidad:.2f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['primario']})
-            ], style={'padding': '12px', 'backgroundColor': f"rgba(44, 90, 160, 0.08)", 'borderRadius': '6px', 'gridColumn': '1'})
+            crear_tarjeta_estadistica("Tiempo a K/2", f"{tiempo_mitad_capacidad:.2f}",
+                                      color_primario, "rgba(44, 90, 160, 0.08)",
+                                      gridColumn='1')
         )
 
+    if not mensaje_visible:
+        return fig, estadisticas, dash.no_update, dash.no_update
+
     return fig, estadisticas, "", {'display': 'none'}
\ No newline at end of file
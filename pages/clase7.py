@@ -18,6 +18,9 @@ import plotly.graph_objects as go
 from scipy.integrate import odeint
 import logging
 
+from pages._memorizacion import memorizar_solo_lectura
+from pages._plantilla_sir import COLORES, PLANTILLA_SIR
+
 # ==========================================
 # CONFIGURACIÓN DE LOGGING
 # ==========================================
@@ -37,24 +40,8 @@ dash.register_page(
 # CONSTANTES Y CONFIGURACIÓN
 # ==========================================
 
-# Paleta de colores profesional
-COLORES = {
-    'primario': '#2C5AA0',          # Azul corporativo
-    'secundario': '#E74C3C',        # Rojo para énfasis
-    'exito': '#27AE60',             # Verde
-    'advertencia': '#F39C12',       # Naranja
-    'fondo_claro': '#ECEFF1',       # Gris muy claro
-    'fondo_oscuro': '#FFFFFF',      # Blanco puro
-    'texto_primario': '#2C3E50',    # Gris oscuro
-    'texto_secundario': '#7F8C8D',  # Gris medio
-    'borde': '#BDC3C7',             # Gris claro
-    'grid': '#ECF0F1',              # Grid tenue
-    
-    # Colores específicos para SIR
-    'susceptibles': '#3498DB',      # Azul claro (Susceptibles)
-    'infectados': '#E74C3C',        # Rojo (Infectados)
-    'recuperados': '#27AE60'        # Verde (Recuperados)
-}
+# La paleta ``COLORES`` viene de pages/_plantilla_sir.py: es la misma con la
+# que se construye la plantilla Plotly de las gráficas
 
 # Estilos reutilizables
 ESTILO_CONTENEDOR = {
@@ -100,6 +87,33 @@ ESTILO_BTN_PRIMARIO = {
     'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.1)'
 }
 
+ESTILO_AYUDA = {
+    'fontSize': '12px',
+    'color': COLORES['texto_secundario'],
+    'marginTop': '-10px'
+}
+
+ESTILO_TARJETA_ETIQUETA = {
+    'margin': '0px',
+    'fontSize': '12px',
+    'color': COLORES['texto_secundario']
+}
+
+# Estilos precalculados de las tarjetas de estadísticas: (tarjeta, valor)
+# por cada color usado en el panel
+ESTILOS_TARJETA = {
+    clave: (
+        {'padding': '12px', 'backgroundColor': fondo, 'borderRadius': '6px'},
+        {'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES[clave]}
+    )
+    for clave, fondo in (
+        ('primario', 'rgba(44, 90, 160, 0.08)'),
+        ('infectados', 'rgba(231, 76, 60, 0.08)'),
+        ('advertencia', 'rgba(243, 156, 18, 0.08)'),
+        ('exito', 'rgba(39, 174, 96, 0.08)'),
+    )
+}
+
 # Rangos de validación
 VALIDACION = {
     'n_min': 10,
@@ -178,11 +192,11 @@ def modelo_sir(y, t, beta, gamma, n):
     S = max(0, min(S, n))
     I = max(0, min(I, n))
     
-    dS_dt = -beta * S * I / n
-    dI_dt = beta * S * I / n - gamma * I
-    dR_dt = gamma * I
+    # Flujo de contagio y de recuperación, calculados una sola vez
+    flujo = beta * S * I / n
+    recuperacion = gamma * I
     
-    return [dS_dt, dI_dt, dR_dt]
+    return [-flujo, flujo - recuperacion, recuperacion]
 
 
 def calcular_sir(n, beta, gamma, i0, t_max, puntos=300):
@@ -197,9 +211,18 @@ def calcular_sir(n, beta, gamma, i0, t_max, puntos=300):
         t_max (float): Tiempo máximo de simulación
         puntos (int): Cantidad de puntos para discretizar
     
+    Los resultados se memorizan por parámetros (los arrays devueltos son
+    de solo lectura y se comparten entre llamadas).
+
     Retorna:
         tuple: (t, S, I, R, r0_val) - arrays y valor de R₀
     """
+    return _calcular_sir_cacheado(n, beta, gamma, i0, t_max, int(puntos))
+
+
+@memorizar_solo_lectura(maxsize=128)
+def _calcular_sir_cacheado(n, beta, gamma, i0, t_max, puntos):
+    """Integración SIR memorizada por ``(n, beta, gamma, i0, t_max, puntos)``."""
     s0 = n - i0
     r0 = 0
     y0 = [s0, i0, r0]
@@ -225,6 +248,54 @@ def calcular_sir(n, beta, gamma, i0, t_max, puntos=300):
     return t, S, I, R, r0_val
 
 
+def crear_grupo_entrada(etiqueta, input_id, valor, clave, paso, placeholder, ayuda):
+    """
+    Genera un grupo etiqueta + input numérico + texto de ayuda.
+
+    Los límites del input se toman de ``VALIDACION`` con las claves
+    ``{clave}_min`` y ``{clave}_max``.
+    """
+    return html.Div([
+        html.Label(etiqueta, htmlFor=input_id, style=ESTILO_LABEL),
+        dcc.Input(
+            id=input_id,
+            type="number",
+            value=valor,
+            min=VALIDACION[f'{clave}_min'],
+            max=VALIDACION[f'{clave}_max'],
+            step=paso,
+            style=ESTILO_INPUT,
+            placeholder=placeholder
+        ),
+        html.P(ayuda, style=ESTILO_AYUDA)
+    ])
+
+
+def crear_tarjeta_indicador(etiqueta, valor, clave_color):
+    """Genera una tarjeta de estadística con los estilos precalculados."""
+    estilo_tarjeta, estilo_valor = ESTILOS_TARJETA[clave_color]
+    return html.Div([
+        html.P(etiqueta, style=ESTILO_TARJETA_ETIQUETA),
+        html.P(valor, style=estilo_valor)
+    ], style=estilo_tarjeta)
+
+
+def reducir_puntos(t, *series, max_puntos=200):
+    """
+    Submuestrea uniformemente las series para graficarlas.
+
+    Conserva el primer y el último punto. Si la malla ya tiene
+    ``max_puntos`` o menos, devuelve los arrays sin copiarlos.
+
+    Retorna:
+        tuple: (t, *series) submuestreados
+    """
+    if len(t) <= max_puntos:
+        return (t, *series)
+    indices = np.linspace(0, len(t) - 1, max_puntos).round().astype(np.intp)
+    return (t[indices], *(serie[indices] for serie in series))
+
+
 def generar_figura_error(mensaje):
     """Genera una figura de error con mensaje personalizado."""
     fig = go.Figure()
@@ -246,6 +317,35 @@ def generar_figura_error(mensaje):
     return fig
 
 
+def preparar_simulacion_sir(n, beta, gamma, i0, t_max, ultimos_parametros):
+    """
+    Paso común de los dos callbacks de la página: descarta parámetros
+    repetidos, valida e integra el modelo.
+
+    Al pasar ambos callbacks por aquí, la gráfica y el panel de indicadores
+    aplican siempre las mismas reglas (y comparten la integración
+    memorizada de ``calcular_sir``).
+
+    Retorna:
+        None si los parámetros coinciden con ``ultimos_parametros`` (no hay
+        nada que actualizar); si no, una tupla (solución, mensaje_error)
+        donde la solución es (t, S, I, R, r0_val), o None junto con el
+        motivo si los parámetros son inválidos o el cálculo falla.
+    """
+    if [n, beta, gamma, i0, t_max] == ultimos_parametros:
+        return None
+
+    es_valido, mensaje_error = validar_parametros_sir(n, beta, gamma, i0, t_max)
+    if not es_valido:
+        return None, mensaje_error
+
+    try:
+        return calcular_sir(n, beta, gamma, i0, t_max, puntos=300), ""
+    except Exception as e:
+        logger.error(f"Error en cálculo SIR: {str(e)}")
+        return None, "Error en el cálculo de la simulación"
+
+
 # ==========================================
 # LAYOUT DE LA PÁGINA
 # ==========================================
@@ -300,120 +400,19 @@ layout = html.Div([
                     }
                 ),
 
-                # Grupo de entrada 1: Población total
-                html.Div([
-                    html.Label(
-                        "Población Total (N)",
-                        htmlFor="input-n-sir",
-                        style=ESTILO_LABEL
-                    ),
-                    dcc.Input(
-                        id="input-n-sir",
-                        type="number",
-                        value=10000,
-                        min=VALIDACION['n_min'],
-                        max=VALIDACION['n_max'],
-                        step=100,
-                        style=ESTILO_INPUT,
-                        placeholder="Población total"
-                    ),
-                    html.P(
-                        "Tamaño de la población en estudio",
-                        style={'fontSize': '12px', 'color': COLORES['texto_secundario'], 'marginTop': '-10px'}
-                    )
-                ]),
-
-                # Grupo de entrada 2: Tasa de transmisión
-                html.Div([
-                    html.Label(
-                        "Tasa de Transmisión (β)",
-                        htmlFor="input-b-sir",
-                        style=ESTILO_LABEL
-                    ),
-                    dcc.Input(
-                        id="input-b-sir",
-                        type="number",
-                        value=0.5,
-                        min=VALIDACION['beta_min'],
-                        max=VALIDACION['beta_max'],
-                        step=0.05,
-                        style=ESTILO_INPUT,
-                        placeholder="Tasa de transmisión"
-                    ),
-                    html.P(
-                        "Contactos efectivos por infectado por día (0.001 - 2.0)",
-                        style={'fontSize': '12px', 'color': COLORES['texto_secundario'], 'marginTop': '-10px'}
-                    )
-                ]),
-
-                # Grupo de entrada 3: Tasa de recuperación
-                html.Div([
-                    html.Label(
-                        "Tasa de Recuperación (γ)",
-                        htmlFor="input-g-sir",
-                        style=ESTILO_LABEL
-                    ),
-                    dcc.Input(
-                        id="input-g-sir",
-                        type="number",
-                        value=0.1,
-                        min=VALIDACION['gamma_min'],
-                        max=VALIDACION['gamma_max'],
-                        step=0.05,
-                        style=ESTILO_INPUT,
-                        placeholder="Tasa de recuperación"
-                    ),
-                    html.P(
-                        "Proporción de recuperación diaria (1/γ = período infeccioso)",
-                        style={'fontSize': '12px', 'color': COLORES['texto_secundario'], 'marginTop': '-10px'}
-                    )
-                ]),
-
-                # Grupo de entrada 4: Infectados iniciales
-                html.Div([
-                    html.Label(
-                        "Infectados Iniciales (I₀)",
-                        htmlFor="input-I0-sir",
-                        style=ESTILO_LABEL
-                    ),
-                    dcc.Input(
-                        id="input-I0-sir",
-                        type="number",
-                        value=10,
-                        min=VALIDACION['i0_min'],
-                        max=VALIDACION['i0_max'],
-                        step=1,
-                        style=ESTILO_INPUT,
-                        placeholder="Infectados iniciales"
-                    ),
-                    html.P(
-                        "Número de personas infectadas al inicio",
-                        style={'fontSize': '12px', 'color': COLORES['texto_secundario'], 'marginTop': '-10px'}
-                    )
-                ]),
-
-                # Grupo de entrada 5: Tiempo máximo
-                html.Div([
-                    html.Label(
-                        "Tiempo de Simulación (días)",
-                        htmlFor="input-tiempo-sir",
-                        style=ESTILO_LABEL
-                    ),
-                    dcc.Input(
-                        id="input-tiempo-sir",
-                        type="number",
-                        value=150,
-                        min=VALIDACION['t_min'],
-                        max=VALIDACION['t_max'],
-                        step=10,
-                        style=ESTILO_INPUT,
-                        placeholder="Días a simular"
-                    ),
-                    html.P(
-                        "Duración de la epidemia a simular",
-                        style={'fontSize': '12px', 'color': COLORES['texto_secundario'], 'marginTop': '-10px'}
-                    )
-                ]),
+                # Grupos de entrada
+                crear_grupo_entrada("Población Total (N)", "input-n-sir", 10000, 'n', 100,
+                                    "Población total", "Tamaño de la población en estudio"),
+                crear_grupo_entrada("Tasa de Transmisión (β)", "input-b-sir", 0.5, 'beta', 0.05,
+                                    "Tasa de transmisión",
+                                    "Contactos efectivos por infectado por día (0.001 - 2.0)"),
+                crear_grupo_entrada("Tasa de Recuperación (γ)", "input-g-sir", 0.1, 'gamma', 0.05,
+                                    "Tasa de recuperación",
+                                    "Proporción de recuperación diaria (1/γ = período infeccioso)"),
+                crear_grupo_entrada("Infectados Iniciales (I₀)", "input-I0-sir", 10, 'i0', 1,
+                                    "Infectados iniciales", "Número de personas infectadas al inicio"),
+                crear_grupo_entrada("Tiempo de Simulación (días)", "input-tiempo-sir", 150, 't', 10,
+                                    "Días a simular", "Duración de la epidemia a simular"),
 
                 # Botón de acción
                 html.Button(
@@ -433,7 +432,10 @@ layout = html.Div([
                         'display': 'none',
                         'fontSize': '13px'
                     }
-                )
+                ),
+
+                # Últimos parámetros simulados (evita recalcular en clics repetidos)
+                dcc.Store(id='ultimos-parametros-sir', storage_type='memory')
 
             ], style={
                 **ESTILO_CONTENEDOR,
@@ -446,15 +448,18 @@ layout = html.Div([
             html.Div([
                 # Gráfica principal
                 html.Div([
-                    dcc.Graph(
-                        id='grafica-sir',
-                        style={'height': '500px', 'width': '100%'},
-                        config={
-                            'responsive': True,
-                            'displayModeBar': True,
-                            'displaylogo': False,
-                            'modeBarButtonsToRemove': ['lasso2d', 'select2d']
-                        }
+                    dcc.Loading(
+                        dcc.Graph(
+                            id='grafica-sir',
+                            style={'height': '500px', 'width': '100%'},
+                            config={
+                                'responsive': True,
+                                'displayModeBar': True,
+                                'displaylogo': False,
+                                'modeBarButtonsToRemove': ['lasso2d', 'select2d']
+                            }
+                        ),
+                        type='circle'
                     )
                 ], style={
                     'backgroundColor': COLORES['fondo_oscuro'],
@@ -474,13 +479,16 @@ layout = html.Div([
                             'marginBottom': '12px'
                         }
                     ),
-                    html.Div(
-                        id="estadisticas-panel-sir",
-                        style={
-                            'display': 'grid',
-                            'gridTemplateColumns': '1fr 1fr',
-                            'gap': '12px'
-                        }
+                    dcc.Loading(
+                        html.Div(
+                            id="estadisticas-panel-sir",
+                            style={
+                                'display': 'grid',
+                                'gridTemplateColumns': '1fr 1fr',
+                                'gap': '12px'
+                            }
+                        ),
+                        type='circle'
                     )
                 ], style={**ESTILO_CONTENEDOR, 'marginTop': '16px'})
 
@@ -513,26 +521,37 @@ layout = html.Div([
 
 @callback(
     [Output('grafica-sir', 'figure'),
-     Output('estadisticas-panel-sir', 'children'),
      Output('mensaje-validacion-sir', 'children'),
-     Output('mensaje-validacion-sir', 'style')],
+     Output('mensaje-validacion-sir', 'style'),
+     Output('ultimos-parametros-sir', 'data')],
     Input('btn-generar-sir', 'n_clicks'),
     [State('input-n-sir', 'value'),
      State('input-b-sir', 'value'),
      State('input-g-sir', 'value'),
      State('input-I0-sir', 'value'),
-     State('input-tiempo-sir', 'value')],
+     State('input-tiempo-sir', 'value'),
+     State('ultimos-parametros-sir', 'data')],
     prevent_initial_call=False
 )
-def simular_sir(n_clicks, n, beta, gamma, i0, t_max):
+def simular_sir(n_clicks, n, beta, gamma, i0, t_max, ultimos_parametros):
     """
     Ejecuta la simulación del modelo SIR y actualiza la gráfica.
-    """
-    # Validar parámetros
-    es_valido, mensaje_error = validar_parametros_sir(n, beta, gamma, i0, t_max)
 
-    if not es_valido:
-        logger.warning(f"Parámetros inválidos SIR: {mensaje_error}")
+    Las estadísticas se calculan en ``actualizar_estadisticas_sir``, un
+    callback aparte, para que la gráfica no espere al panel. Ambos
+    comparten la integración memorizada de ``calcular_sir``.
+
+    Si los parámetros coinciden con los de la última ejecución (guardados
+    en ``ultimos-parametros-sir``), no se recalcula nada.
+    """
+    resultado = preparar_simulacion_sir(n, beta, gamma, i0, t_max, ultimos_parametros)
+    if resultado is None:
+        return (dash.no_update,) * 4
+
+    parametros = [n, beta, gamma, i0, t_max]
+    solucion, mensaje_error = resultado
+    if solucion is None:
+        logger.warning(f"Simulación SIR no realizada: {mensaje_error}")
         fig_error = generar_figura_error(mensaje_error)
         
         estilo_error = {
@@ -545,21 +564,23 @@ def simular_sir(n_clicks, n, beta, gamma, i0, t_max):
             'fontSize': '13px'
         }
         
-        return fig_error, [], mensaje_error, estilo_error
+        return fig_error, mensaje_error, estilo_error, parametros
 
-    # Calcular dinámica epidemiológica
-    try:
-        t, S, I, R, r0_val = calcular_sir(n, beta, gamma, i0, t_max, puntos=300)
-        logger.info(f"Simulación SIR calculada: N={n}, β={beta}, γ={gamma}, I₀={i0}, R₀={r0_val:.3f}")
-    except Exception as e:
-        logger.error(f"Error en cálculo SIR: {str(e)}")
-        fig_error = generar_figura_error("Error en el cálculo de la simulación")
-        return fig_error, [], "Error interno", {'display': 'none'}
+    t, S, I, R, r0_val = solucion
+    logger.info(f"Simulación SIR calculada: N={n}, β={beta}, γ={gamma}, I₀={i0}, R₀={r0_val:.3f}")
+
+    # Series submuestreadas para la gráfica (las estadísticas usan la malla completa)
+    t_graf, S_graf, I_graf, R_graf = reducir_puntos(t, S, I, R)
+
+    # Las tres curvas se envían como un único bloque float32 (filas S, I, R):
+    # la precisión sobra para graficar y reduce a la mitad los datos enviados
+    t_graf = t_graf.astype(np.float32)
+    sir_graf = np.array([S_graf, I_graf, R_graf], dtype=np.float32)
 
     # Crear trazos
-    trace_susceptibles = go.Scatter(
-        x=t,
-        y=S,
+    trace_susceptibles = go.Scattergl(
+        x=t_graf,
+        y=sir_graf[0],
         mode='lines',
         name='Susceptibles (S)',
         line=dict(
@@ -569,9 +590,9 @@ def simular_sir(n_clicks, n, beta, gamma, i0, t_max):
         hovertemplate='<b>Día:</b> %{x:.1f}<br><b>Susceptibles:</b> %{y:.0f}<extra></extra>'
     )
 
-    trace_infectados = go.Scatter(
-        x=t,
-        y=I,
+    trace_infectados = go.Scattergl(
+        x=t_graf,
+        y=sir_graf[1],
         mode='lines',
         name='Infectados (I)',
         line=dict(
@@ -583,9 +604,9 @@ def simular_sir(n_clicks, n, beta, gamma, i0, t_max):
         hovertemplate='<b>Día:</b> %{x:.1f}<br><b>Infectados:</b> %{y:.0f}<extra></extra>'
     )
 
-    trace_recuperados = go.Scatter(
-        x=t,
-        y=R,
+    trace_recuperados = go.Scattergl(
+        x=t_graf,
+        y=sir_graf[2],
         mode='lines',
         name='Recuperados (R)',
         line=dict(
@@ -603,6 +624,7 @@ def simular_sir(n_clicks, n, beta, gamma, i0, t_max):
     color_titulo = COLORES['secundario'] if r0_val > 1 else COLORES['exito']
 
     fig.update_layout(
+        template=PLANTILLA_SIR,
         title={
             'text': f'<b>Dinámica del Modelo SIR</b><br><sub>{tipo_epidemia} | R₀ = {r0_val:.3f}</sub>',
             'font': {'size': 18, 'color': color_titulo},
@@ -611,90 +633,68 @@ def simular_sir(n_clicks, n, beta, gamma, i0, t_max):
         },
         xaxis_title='Tiempo (días)',
         yaxis_title='Número de personas',
-        hovermode='x unified',
-        
-        # Estilos de fondo y texto
-        paper_bgcolor=COLORES['fondo_claro'],
-        plot_bgcolor=COLORES['fondo_oscuro'],
-        font=dict(color=COLORES['texto_primario'], size=12),
-
-        # Configuración de ejes
-        xaxis=dict(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor=COLORES['grid'],
-            zeroline=False,
-            showline=True,
-            linewidth=1,
-            linecolor=COLORES['borde'],
-            mirror=False,
-            range=[0, t_max]
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor=COLORES['grid'],
-            zeroline=False,
-            showline=True,
-            linewidth=1,
-            linecolor=COLORES['borde'],
-            mirror=False
-        ),
-
-        # Leyenda
+        xaxis_range=[0, t_max],
         legend=dict(
             orientation='h',
             yanchor='bottom',
             y=1.00,
             xanchor='right',
-            x=1.0,
-            bgcolor='rgba(255, 255, 255, 0.8)',
-            bordercolor=COLORES['borde'],
-            borderwidth=1
+            x=1.0
         ),
-
         margin=dict(l=60, r=40, t=100, b=60),
         height=500
     )
 
-    # Calcular estadísticas
-    pico_infectados = np.max(I)
-    dia_pico = t[np.argmax(I)] if len(I) > 0 else 0
-    total_infectados = i0 + (R[-1] if len(R) > 0 else 0)
-    tasa_ataque = (total_infectados / n * 100) if n > 0 else 0
-    dias_infeccion = 1 / gamma if gamma != 0 else 0
+    # La figura se serializa aquí mismo a su forma dict (Dash la acepta
+    # directamente en la propiedad ``figure``)
+    return fig.to_plotly_json(), "", {'display': 'none'}, parametros
 
-    # Crear tarjetas de estadísticas
-    estadisticas = [
-        html.Div([
-            html.P("R₀ (Número Reproductivo)", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{r0_val:.3f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['primario']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(44, 90, 160, 0.08)", 'borderRadius': '6px'}),
 
-        html.Div([
-            html.P("Pico de Infectados", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{pico_infectados:.0f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['infectados']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(231, 76, 60, 0.08)", 'borderRadius': '6px'}),
+@callback(
+    Output('estadisticas-panel-sir', 'children'),
+    Input('btn-generar-sir', 'n_clicks'),
+    [State('input-n-sir', 'value'),
+     State('input-b-sir', 'value'),
+     State('input-g-sir', 'value'),
+     State('input-I0-sir', 'value'),
+     State('input-tiempo-sir', 'value'),
+     State('ultimos-parametros-sir', 'data')],
+    prevent_initial_call=False
+)
+def actualizar_estadisticas_sir(n_clicks, n, beta, gamma, i0, t_max, ultimos_parametros):
+    """
+    Actualiza el panel de indicadores epidemiológicos.
 
-        html.Div([
-            html.P("Día del Pico", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{dia_pico:.1f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['advertencia']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(243, 156, 18, 0.08)", 'borderRadius': '6px'}),
+    Pasa por ``preparar_simulacion_sir`` igual que ``simular_sir``, así que
+    con parámetros inválidos o repetidos ambos callbacks coinciden.
+    """
+    resultado = preparar_simulacion_sir(n, beta, gamma, i0, t_max, ultimos_parametros)
+    if resultado is None:
+        return dash.no_update
 
-        html.Div([
-            html.P("Tasa de Ataque (%)", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{tasa_ataque:.1f}%", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['exito']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(39, 174, 96, 0.08)", 'borderRadius': '6px'}),
+    solucion, _ = resultado
+    if solucion is None:
+        return []
 
-        html.Div([
-            html.P("Días de Infección (1/γ)", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{dias_infeccion:.1f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['primario']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(44, 90, 160, 0.08)", 'borderRadius': '6px'}),
+    t, S, I, R, r0_val = solucion
 
-        html.Div([
-            html.P("Total Infectados", style={'margin': '0px', 'fontSize': '12px', 'color': COLORES['texto_secundario']}),
-            html.P(f"{total_infectados:.0f}", style={'margin': '8px 0px 0px', 'fontSize': '20px', 'fontWeight': '600', 'color': COLORES['infectados']})
-        ], style={'padding': '12px', 'backgroundColor': f"rgba(231, 76, 60, 0.08)", 'borderRadius': '6px'})
+    # Calcular estadísticas
+    # calcular_sir siempre devuelve series no vacías: un solo recorrido de I
+    idx_pico = int(I.argmax())
+    pico_infectados = float(I[idx_pico])
+    dia_pico = float(t[idx_pico])
+    total_infectados = float(i0 + R[-1])
+    tasa_ataque = total_infectados / n * 100.0 if n > 0 else 0.0
+    dias_infeccion = 1 / gamma if gamma != 0 else 0
+
+    # Crear tarjetas de estadísticas
+    estadisticas = [
+        crear_tarjeta_indicador("R₀ (Número Reproductivo)", f"{r0_val:.3f}", 'primario'),
+        crear_tarjeta_indicador("Pico de Infectados", f"{pico_infectados:.0f}", 'infectados'),
+        crear_tarjeta_indicador("Día del Pico", f"{dia_pico:.1f}", 'advertencia'),
+        crear_tarjeta_indicador("Tasa de Ataque (%)", f"{tasa_ataque:.1f}%", 'exito'),
+        crear_tarjeta_indicador("Días de Infección (1/γ)", f"{dias_infeccion:.1f}", 'primario'),
+        crear_tarjeta_indicador("Total Infectados", f"{total_infectados:.0f}", 'infectados')
     ]
 
-    return fig, estadisticas, "", {'display': 'none'}
\ No newline at end of file
+    return estadisticas
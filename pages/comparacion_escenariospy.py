@@ -11,14 +11,17 @@ Fecha: 2025-11-29
 """
 
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple
 
 import dash
-from dash import html, dcc, Input, Output, State, callback
-import plotly.graph_objects as go
+from dash import html, dcc, Input, Output, State, callback, clientside_callback
+from plotly.io.json import to_json_plotly
 from plotly.subplots import make_subplots
 import numpy as np
-from scipy.integrate import odeint
+
+from pages._memorizacion import memorizar_solo_lectura
+from pages._plantilla_sir import PLANTILLA_SIR
+from pages._serializacion import codificar_float32
 
 # ==========================
 # CONFIGURACIÓN DE LOGGING
@@ -43,32 +46,75 @@ dash.register_page(
 # FUNCIONES AUXILIARES
 # ==========================
 
-def modelo_rumores(y, t, beta, gamma):
+def integrar_rk4(beta: float, gamma: float, t: np.ndarray, N: float, I0: float,
+                 subpasos: int = 2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Modelo SIR adaptado para la propagación de rumores.
+    Integra el modelo SIR de rumores con Runge-Kutta 4 de paso fijo:
+
+        dS/dt = -β·S·I/N,  dI/dt = β·S·I/N - γ·I,  dR/dt = γ·I
+
+    El flujo de contagio β·S·I/N se calcula una sola vez por etapa. Como
+    N = S + I + R se conserva, solo se integran S e I y R se obtiene al
+    final como N - S - I. Las etapas de RK4 se evalúan con escalares de
+    Python, sin construir listas ni arrays en cada paso.
 
     Parámetros:
     -----------
-    y : tuple
-        Estados: (S, I, R) = Susceptibles, Infectados, Recuperados
-    t : float
-        Tiempo
     beta : float
         Tasa de propagación
     gamma : float
-        Tasa de recuperación (aburrimiento/racionalidad)
+        Tasa de recuperación
+    t : np.ndarray
+        Malla temporal uniforme donde se reporta la solución
+    N : float
+        Población total
+    I0 : float
+        Infectados iniciales (R0 = 0)
+    subpasos : int
+        Pasos de RK4 entre dos puntos consecutivos de ``t``
 
     Retorna:
     --------
     tuple
-        Derivadas (dS/dt, dI/dt, dR/dt)
+        Arrays S, I, R evaluados en ``t``
     """
-    S, I, R = y
-    N = S + I + R
-    dSdt = -beta * S * I / N
-    dIdt = beta * S * I / N - gamma * I
-    dRdt = gamma * I
-    return [dSdt, dIdt, dRdt]
+    n = len(t)
+    S = np.empty(n)
+    I = np.empty(n)
+    s = float(N - I0)
+    i = float(I0)
+    S[0] = s
+    I[0] = i
+
+    if n > 1:
+        h = float(t[1] - t[0]) / subpasos
+        h2 = 0.5 * h
+        h6 = h / 6.0
+        b = beta / N
+        for k in range(1, n):
+            for _ in range(subpasos):
+                f = b * s * i
+                ks1 = -f
+                ki1 = f - gamma * i
+                s2 = s + h2 * ks1
+                i2 = i + h2 * ki1
+                f = b * s2 * i2
+                ks2 = -f
+                ki2 = f - gamma * i2
+                s3 = s + h2 * ks2
+                i3 = i + h2 * ki2
+                f = b * s3 * i3
+                ks3 = -f
+                ki3 = f - gamma * i3
+                s4 = s + h * ks3
+                i4 = i + h * ki3
+                f = b * s4 * i4
+                s += h6 * (ks1 + 2.0 * (ks2 + ks3) - f)
+                i += h6 * (ki1 + 2.0 * (ki2 + ki3) + f - gamma * i4)
+            S[k] = s
+            I[k] = i
+
+    return S, I, N - S - I
 
 def simular_escenario(beta: float, gamma: float, dias: int = 100) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
@@ -86,52 +132,61 @@ def simular_escenario(beta: float, gamma: float, dias: int = 100) -> Tuple[np.nd
     Retorna:
     --------
     tuple
-        Arrays de tiempo, S, I, R
+        Arrays de tiempo, S, I, R (de solo lectura; se comparten entre
+        llamadas con los mismos parámetros)
     """
+    return _simular_escenario_cacheado(round(float(beta), 4), round(float(gamma), 4), int(dias))
+
+@memorizar_solo_lectura(maxsize=256)
+def _simular_escenario_cacheado(beta: float, gamma: float, dias: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Simulación memoizada por ``(beta, gamma, dias)`` ya redondeados."""
     N = 1000
     I0 = 1
-    R0 = 0
-    S0 = N - I0 - R0
-    y0 = [S0, I0, R0]
-    t = np.linspace(0, dias, dias)
+    # Malla diaria 0, 1, ..., dias (paso exacto de un día)
+    t = np.arange(dias + 1, dtype=np.float64)
 
     try:
-        result = odeint(modelo_rumores, y0, t, args=(beta, gamma))
-        S, I, R = result.T
-        return t, S, I, R
+        S, I, R = integrar_rk4(beta, gamma, t, N, I0)
     except Exception as e:
         logger.error(f"Error en la simulación: {e}")
         raise
 
+    return t, S, I, R
+
 # ==========================
 # DISEÑO DE LA INTERFAZ
 # ==========================
 
+# Marcas compartidas por los cuatro sliders (0.1 ... 1.0)
+MARCAS_SLIDER = {i / 10: f"{i / 10:.1f}" for i in range(1, 11)}
+
 layout = html.Div([
     html.H2("Comparación de Escenarios - Propagación de Rumores", className="text-center mb-4"),
 
     html.Div([
         html.Label("Tasa de propagación (β) - Escenario 1:"),
-        dcc.Slider(id='beta1', min=0.1, max=1.0, step=0.05, value=0.5, marks={i/10: str(i/10) for i in range(1, 11)}),
+        dcc.Slider(id='beta1', min=0.1, max=1.0, step=0.05, value=0.5, marks=MARCAS_SLIDER),
     ], className="mb-3"),
 
     html.Div([
         html.Label("Tasa de recuperación (γ) - Escenario 1:"),
-        dcc.Slider(id='gamma1', min=0.1, max=1.0, step=0.05, value=0.2, marks={i/10: str(i/10) for i in range(1, 11)}),
+        dcc.Slider(id='gamma1', min=0.1, max=1.0, step=0.05, value=0.2, marks=MARCAS_SLIDER),
     ], className="mb-3"),
 
     html.Div([
         html.Label("Tasa de propagación (β) - Escenario 2:"),
-        dcc.Slider(id='beta2', min=0.1, max=1.0, step=0.05, value=0.7, marks={i/10: str(i/10) for i in range(1, 11)}),
+        dcc.Slider(id='beta2', min=0.1, max=1.0, step=0.05, value=0.7, marks=MARCAS_SLIDER),
     ], className="mb-3"),
 
     html.Div([
         html.Label("Tasa de recuperación (γ) - Escenario 2:"),
-        dcc.Slider(id='gamma2', min=0.1, max=1.0, step=0.05, value=0.3, marks={i/10: str(i/10) for i in range(1, 11)}),
+        dcc.Slider(id='gamma2', min=0.1, max=1.0, step=0.05, value=0.3, marks=MARCAS_SLIDER),
     ], className="mb-3"),
 
     html.Button("Simular", id='btn-simular', n_clicks=0, className="btn btn-primary mb-4"),
 
+    dcc.Store(id='datos-comparacion', storage_type='memory'),
+    dcc.Store(id='ultimos-parametros-comparacion', storage_type='memory'),
     dcc.Graph(id='grafico-comparacion')
 ], className="container mt-5")
 
@@ -139,53 +194,90 @@ layout = html.Div([
 # CALLBACKS
 # ==========================
 
+# Esqueleto fijo de la figura (subgráficas, títulos y plantilla). Se genera
+# una sola vez y el callback de cliente solo le añade las curvas.
+_LAYOUT_COMPARACION = make_subplots(
+    rows=1, cols=2,
+    subplot_titles=("Escenario 1", "Escenario 2"),
+    shared_yaxes=True
+).update_layout(
+    title="Comparación de Escenarios de Propagación de Rumores",
+    xaxis_title="Días",
+    yaxis_title="Población",
+    template=PLANTILLA_SIR
+).to_plotly_json()['layout']
+
 @callback(
-    Output('grafico-comparacion', 'figure'),
+    Output('datos-comparacion', 'data'),
+    Output('ultimos-parametros-comparacion', 'data'),
     Input('btn-simular', 'n_clicks'),
     State('beta1', 'value'),
     State('gamma1', 'value'),
     State('beta2', 'value'),
-    State('gamma2', 'value')
+    State('gamma2', 'value'),
+    State('ultimos-parametros-comparacion', 'data')
 )
-def actualizar_grafico(n_clicks, beta1, gamma1, beta2, gamma2):
+def actualizar_grafico(n_clicks, beta1, gamma1, beta2, gamma2, ultimos_parametros):
     """
-    Actualiza el gráfico de comparación entre dos escenarios.
+    Simula los dos escenarios y publica sus series en ``datos-comparacion``.
+
+    La figura se arma en el navegador (ver el ``clientside_callback`` de
+    abajo); el servidor solo envía los arrays numéricos, codificados como
+    typed arrays float32. Si los parámetros
+    coinciden con los de la última simulación no se envía nada.
     """
     if n_clicks == 0:
-        return go.Figure()
-
-    try:
-        t1, S1, I1, R1 = simular_escenario(beta1, gamma1)
-        t2, S2, I2, R2 = simular_escenario(beta2, gamma2)
-
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=("Escenario 1", "Escenario 2"),
-            shared_yaxes=True
-        )
-
-        fig.add_trace(go.Scatter(x=t1, y=I1, mode='lines', name='Infectados (I)', line=dict(color='red')), row=1, col=1)
-        fig.add_trace(go.Scatter(x=t1, y=S1, mode='lines', name='Susceptibles (S)', line=dict(color='blue')), row=1, col=1)
-        fig.add_trace(go.Scatter(x=t1, y=R1, mode='lines', name='Recuperados (R)', line=dict(color='green')), row=1, col=1)
-
-        fig.add_trace(go.Scatter(x=t2, y=I2, mode='lines', name='Infectados (I)', line=dict(color='red'), showlegend=False), row=1, col=2)
-        fig.add_trace(go.Scatter(x=t2, y=S2, mode='lines', name='Susceptibles (S)', line=dict(color='blue'), showlegend=False), row=1, col=2)
-        fig.add_trace(go.Scatter(x=t2, y=R2, mode='lines', name='Recuperados (R)', line=dict(color='green'), showlegend=False), row=1, col=2)
+        return None, None
 
-        fig.update_layout(
-            title="Comparación de Escenarios de Propagación de Rumores",
-            xaxis_title="Días",
-            yaxis_title="Población",
-            hovermode='x unified',
-            template='plotly_white'
-        )
+    parametros = [beta1, gamma1, beta2, gamma2]
+    if parametros == ultimos_parametros:
+        return dash.no_update, dash.no_update
 
-        return fig
+    try:
+        escenarios = []
+        for beta, gamma in ((beta1, gamma1), (beta2, gamma2)):
+            t, S, I, R = simular_escenario(beta, gamma)
+            escenarios.append({'t': codificar_float32(t), 'S': codificar_float32(S),
+                               'I': codificar_float32(I), 'R': codificar_float32(R)})
+        return {'escenarios': escenarios}, parametros
 
     except Exception as e:
         logger.error(f"Error al generar gráfico: {e}")
-        return go.Figure().add_annotation(
-            text="Error al generar gráfico",
-            xref="paper", yref="paper",
-            showarrow=False, font=dict(size=20)
-        )
\ No newline at end of file
+        return {'error': "Error al generar gráfico"}, parametros
+
+clientside_callback(
+    """
+    function(datos) {
+        if (!datos) {
+            return {data: [], layout: {}};
+        }
+        if (datos.error) {
+            return {data: [], layout: {annotations: [{
+                text: datos.error, xref: 'paper', yref: 'paper',
+                showarrow: false, font: {size: 20}
+            }]}};
+        }
+        const series = [
+            ['I', 'Infectados (I)', 'red'],
+            ['S', 'Susceptibles (S)', 'blue'],
+            ['R', 'Recuperados (R)', 'green']
+        ];
+        const data = [];
+        datos.escenarios.forEach(function(esc, k) {
+            series.forEach(function(serie) {
+                data.push({
+                    type: 'scattergl', mode: 'lines',
+                    x: esc.t, y: esc[serie[0]],
+                    name: serie[1], line: {color: serie[2]},
+                    showlegend: k === 0,
+                    xaxis: k === 0 ? 'x' : 'x2',
+                    yaxis: k === 0 ? 'y' : 'y2'
+                });
+            });
+        });
+        return {data: data, layout: %s};
+    }
+    """ % to_json_plotly(_LAYOUT_COMPARACION),
+    Output('grafico-comparacion', 'figure'),
+    Input('datos-comparacion', 'data')
+)
@@ -9,6 +9,8 @@ Autor: Jhovany Calixto
 Versión: 2.0 (Profesional)
 """
 
+from functools import cache
+
 import dash
 from dash import html
 
@@ -62,444 +64,382 @@ ESTILO_BTN_SECUNDARIO = {
     'boxShadow': '0 2px 8px rgba(44, 90, 160, 0.1)'
 }
 
+# Contenedores simples que se repiten en varias secciones
+ESTILO_BLOQUE_HERO = {'marginBottom': '32px'}
+ESTILO_CENTRADO = {'textAlign': 'center'}
+
+# Títulos y textos compartidos por varias secciones
+ESTILO_TITULO_SECCION = {
+    'fontSize': '32px',
+    'fontWeight': '700',
+    'color': COLORES['primario'],
+    'marginBottom': '32px',
+    'textAlign': 'center'
+}
+
+ESTILO_SUBTITULO = {
+    'fontSize': '18px',
+    'fontWeight': '600',
+    'color': COLORES['primario'],
+    'marginBottom': '16px'
+}
+
+ESTILO_SUBTITULO_BLOQUE = {**ESTILO_SUBTITULO, 'marginTop': '0px'}
+
+ESTILO_PARRAFO = {
+    'fontSize': '16px',
+    'lineHeight': '1.7',
+    'color': COLORES['texto_primario'],
+    'marginBottom': '16px'
+}
+
+# Competencias técnicas
+ESTILO_FILA_COMPETENCIA = {'display': 'flex', 'alignItems': 'flex-start', 'marginBottom': '16px'}
+ESTILO_ICONO_COMPETENCIA = {'fontSize': '24px', 'marginRight': '8px'}
+ESTILO_NOMBRE_COMPETENCIA = {'margin': '0px', 'fontWeight': '600', 'fontSize': '14px'}
+ESTILO_DETALLE_COMPETENCIA = {'margin': '4px 0px 0px', 'fontSize': '13px', 'color': COLORES['texto_secundario']}
+
+# Tarjetas de estadísticas destacadas
+ESTILO_TARJETA_DESTACADA = {
+    'padding': '24px',
+    'backgroundColor': 'rgba(44, 90, 160, 0.08)',
+    'borderRadius': '8px',
+    'border': f"1px solid {COLORES['borde']}"
+}
+
+ESTILO_CIFRA_DESTACADA = {
+    'fontSize': '36px',
+    'fontWeight': '700',
+    'color': COLORES['primario'],
+    'margin': '0px',
+    'marginBottom': '8px'
+}
+
+ESTILO_LEYENDA_DESTACADA = {
+    'fontSize': '14px',
+    'color': COLORES['texto_secundario'],
+    'margin': '0px'
+}
+
+# Columnas del stack tecnológico
+ESTILO_COLUMNA_STACK = {'flex': '1', 'minWidth': '250px'}
+ESTILO_LISTA_STACK = {'paddingLeft': '20px', 'color': COLORES['texto_primario']}
+
+# Contenido de las secciones repetitivas: (ícono, título, detalle)
+COMPETENCIAS = (
+    ("🐍", "Lenguajes", "Python, JavaScript, TypeScript"),
+    ("⚙️", "Frameworks", "Dash, Flask, FastAPI, React"),
+    ("📊", "Modelado", "EDOs, Simulaciones, Optimización, LLMs"),
+)
+
+# (cifra, leyenda, color de fondo)
+DESTACADOS = (
+    ("3+", "Años de Experiencia", 'rgba(44, 90, 160, 0.08)'),
+    ("10+", "Proyectos Completados", 'rgba(39, 174, 96, 0.08)'),
+    ("100%", "Comprometido", 'rgba(243, 156, 18, 0.08)'),
+)
+
+# (título de la columna, tecnologías)
+STACK = (
+    ("Backend", ("Python (NumPy, SciPy, Pandas)", "FastAPI & Flask",
+                 "PostgreSQL & MongoDB", "Docker & Kubernetes")),
+    ("Frontend", ("React & TypeScript", "Dash (Plotly)",
+                  "HTML5 & CSS3", "Responsive Design")),
+    ("Modelado & IA", ("Ecuaciones Diferenciales", "Simulaciones Numéricas",
+                       "Integración con LLMs", "Análisis Estadístico")),
+)
+
 # ==========================================
-# LAYOUT DE LA PÁGINA
+# COMPONENTES
 # ==========================================
 
-layout = html.Div([
-    # Sección Hero
-    html.Div([
+def crear_competencia(icono, titulo, detalle, ultima=False):
+    """Fila de la tarjeta de competencias (la última va sin margen inferior)."""
+    return html.Div([
+        html.Span(icono, style=ESTILO_ICONO_COMPETENCIA),
         html.Div([
-            # Columna izquierda: Contenido
-            html.Div([
-                # Nombre y título
-                html.Div([
-                    html.H1(
-                        "Jhovany Calixto",
-                        style={
-                            'fontSize': '48px',
-                            'fontWeight': '700',
-                            'color': COLORES['primario'],
-                            'marginBottom': '8px',
-                            'marginTop': '0px'
-                        }
-                    ),
-                    html.H2(
-                        "Desarrollador Fullstack • Modelador Matemático",
-                        style={
-                            'fontSize': '24px',
-                            'fontWeight': '600',
-                            'color': COLORES['texto_secundario'],
-                            'marginBottom': '24px',
-                            'marginTop': '0px'
-                        }
-                    )
-                ], style={'marginBottom': '32px'}),
+            html.P(titulo, style=ESTILO_NOMBRE_COMPETENCIA),
+            html.P(detalle, style=ESTILO_DETALLE_COMPETENCIA)
+        ])
+    ], style={**ESTILO_FILA_COMPETENCIA, 'marginBottom': '0px'} if ultima else ESTILO_FILA_COMPETENCIA)
 
-                # Descripción profesional
-                html.Div([
-                    html.P(
-                        "Soy desarrollador Fullstack con experiencia en desarrollo backend y frontend, "
-                        "especializado en modelamiento matemático y análisis numérico. Utilizo herramientas "
-                        "modernas como Dash, FastAPI, React y bibliotecas científicas de Python para crear "
-                        "soluciones escalables e innovadoras.",
-                        style={
-                            'fontSize': '16px',
-                            'lineHeight': '1.7',
-                            'color': COLORES['texto_primario'],
-                            'marginBottom': '16px'
-                        }
-                    ),
-                    html.P(
-                        "Integro modelos asistidos por LLMs (ChatGPT, Claude) para acelerar y mejorar procesos "
-                        "de modelado: generación de código de simulación, ajuste de parámetros, explicaciones "
-                        "técnicas profundas y validación de resultados. Esto permite crear soluciones complejas "
-                        "de forma más eficiente.",
-                        style={
-                            'fontSize': '16px',
-                            'lineHeight': '1.7',
-                            'color': COLORES['texto_primario'],
-                            'marginBottom': '24px'
-                        }
-                    )
-                ]),
 
-                # Competencias técnicas
-                html.Div([
-                    html.H3(
-                        "Competencias Técnicas",
-                        style={
-                            'fontSize': '18px',
-                            'fontWeight': '600',
-                            'color': COLORES['primario'],
-                            'marginBottom': '16px',
-                            'marginTop': '0px'
-                        }
-                    ),
-                    html.Div([
-                        # Grid de competencias
-                        html.Div([
-                            html.Div([
-                                html.Span("🐍", style={'fontSize': '24px', 'marginRight': '8px'}),
-                                html.Div([
-                                    html.P("Lenguajes", style={'margin': '0px', 'fontWeight': '600', 'fontSize': '14px'}),
-                                    html.P("Python, JavaScript, TypeScript", style={'margin': '4px 0px 0px', 'fontSize': '13px', 'color': COLORES['texto_secundario']})
-                                ])
-                            ], style={'display': 'flex', 'alignItems': 'flex-start', 'marginBottom': '16px'}),
+def crear_tarjeta_destacada(cifra, leyenda, fondo):
+    """Tarjeta con una cifra destacada y su leyenda."""
+    return html.Div([
+        html.Div([
+            html.H3(cifra, style=ESTILO_CIFRA_DESTACADA),
+            html.P(leyenda, style=ESTILO_LEYENDA_DESTACADA)
+        ], style=ESTILO_CENTRADO)
+    ], style={**ESTILO_TARJETA_DESTACADA, 'backgroundColor': fondo})
 
-                            html.Div([
-                                html.Span("⚙️", style={'fontSize': '24px', 'marginRight': '8px'}),
-                                html.Div([
-                                    html.P("Frameworks", style={'margin': '0px', 'fontWeight': '600', 'fontSize': '14px'}),
-                                    html.P("Dash, Flask, FastAPI, React", style={'margin': '4px 0px 0px', 'fontSize': '13px', 'color': COLORES['texto_secundario']})
-                                ])
-                            ], style={'display': 'flex', 'alignItems': 'flex-start', 'marginBottom': '16px'}),
 
-                            html.Div([
-                                html.Span("📊", style={'fontSize': '24px', 'marginRight': '8px'}),
-                                html.Div([
-                                    html.P("Modelado", style={'margin': '0px', 'fontWeight': '600', 'fontSize': '14px'}),
-                                    html.P("EDOs, Simulaciones, Optimización, LLMs", style={'margin': '4px 0px 0px', 'fontSize': '13px', 'color': COLORES['texto_secundario']})
-                                ])
-                            ], style={'display': 'flex', 'alignItems': 'flex-start', 'marginBottom': '0px'}),
-                        ], style={'backgroundColor': f"rgba(44, 90, 160, 0.05)", 'padding': '20px', 'borderRadius': '8px', 'borderLeft': f"4px solid {COLORES['primario']}"})
-                    ])
-                ], style={'marginBottom': '32px'}),
+def crear_columna_stack(titulo, tecnologias):
+    """Columna del stack tecnológico con su lista de herramientas."""
+    return html.Div([
+        html.H3(titulo, style=ESTILO_SUBTITULO),
+        html.Ul([html.Li(tecnologia) for tecnologia in tecnologias], style=ESTILO_LISTA_STACK)
+    ], style=ESTILO_COLUMNA_STACK)
+
+
+# ==========================================
+# LAYOUT DE LA PÁGINA
+# ==========================================
+
+def layout(**kwargs):
+    """
+    Layout de la página, construido al visitar la ruta por primera vez.
+
+    Dash llama a esta función en cada visita (los parámetros de la URL
+    llegan en ``kwargs`` y no se usan); el árbol es estático, así que se
+    construye una sola vez y se reutiliza.
+    """
+    return _construir_layout()
 
-                # Llamadas a la acción
+
+@cache
+def _construir_layout():
+    """Árbol de componentes de la portada (memorizado)."""
+    return html.Div([
+        # Sección Hero
+        html.Div([
+            html.Div([
+                # Columna izquierda: Contenido
                 html.Div([
-                    html.H3(
-                        "Conéctate Conmigo",
-                        style={
-                            'fontSize': '18px',
-                            'fontWeight': '600',
-                            'color': COLORES['primario'],
-                            'marginBottom': '16px',
-                            'marginTop': '0px'
-                        }
-                    ),
+                    # Nombre y título
                     html.Div([
-                        html.A(
-                            "GitHub",
-                            href="https://github.com/",
-                            target="_blank",
-                            rel="noopener noreferrer",
+                        html.H1(
+                            "Jhovany Calixto",
                             style={
-                                **ESTILO_BTN_PRIMARIO,
-                                'marginRight': '12px'
+                                'fontSize': '48px',
+                                'fontWeight': '700',
+                                'color': COLORES['primario'],
+                                'marginBottom': '8px',
+                                'marginTop': '0px'
                             }
                         ),
-                        html.A(
-                            "LinkedIn",
-                            href="https://www.linkedin.com/",
-                            target="_blank",
-                            rel="noopener noreferrer",
-                            style=ESTILO_BTN_SECUNDARIO
-                        ),
-                        html.A(
-                            "Enviar Email",
-                            href="mailto:tu.email@ejemplo.com",
+                        html.H2(
+                            "Desarrollador Fullstack • Modelador Matemático",
                             style={
-                                **ESTILO_BTN_PRIMARIO,
-                                'marginRight': '0px'
+                                'fontSize': '24px',
+                                'fontWeight': '600',
+                                'color': COLORES['texto_secundario'],
+                                'marginBottom': '24px',
+                                'marginTop': '0px'
                             }
                         )
-                    ], style={'display': 'flex', 'flexWrap': 'wrap', 'alignItems': 'center'})
-                ])
+                    ], style=ESTILO_BLOQUE_HERO),
 
-            ], style={
-                'flex': '1',
-                'minWidth': '300px',
-                'paddingRight': '40px'
-            }),
+                    # Descripción profesional
+                    html.Div([
+                        html.P(
+                            "Soy desarrollador Fullstack con experiencia en desarrollo backend y frontend, "
+                            "especializado en modelamiento matemático y análisis numérico. Utilizo herramientas "
+                            "modernas como Dash, FastAPI, React y bibliotecas científicas de Python para crear "
+                            "soluciones escalables e innovadoras.",
+                            style=ESTILO_PARRAFO
+                        ),
+                        html.P(
+                            "Integro modelos asistidos por LLMs (ChatGPT, Claude) para acelerar y mejorar procesos "
+                            "de modelado: generación de código de simulación, ajuste de parámetros, explicaciones "
+                            "técnicas profundas y validación de resultados. Esto permite crear soluciones complejas "
+                            "de forma más eficiente.",
+                            style={**ESTILO_PARRAFO, 'marginBottom': '24px'}
+                        )
+                    ]),
 
-            # Columna derecha: Imagen/Ilustración
-            html.Div([
+                    # Competencias técnicas
+                    html.Div([
+                        html.H3(
+                            "Competencias Técnicas",
+                            style=ESTILO_SUBTITULO_BLOQUE
+                        ),
+                        html.Div([
+                            # Grid de competencias
+                            html.Div([
+                                crear_competencia(*competencia, ultima=(k == len(COMPETENCIAS) - 1))
+                                for k, competencia in enumerate(COMPETENCIAS)
+                            ], style={'backgroundColor': f"rgba(44, 90, 160, 0.05)", 'padding': '20px', 'borderRadius': '8px', 'borderLeft': f"4px solid {COLORES['primario']}"})
+                        ])
+                    ], style=ESTILO_BLOQUE_HERO),
+
+                    # Llamadas a la acción
+                    html.Div([
+                        html.H3(
+                            "Conéctate Conmigo",
+                            style=ESTILO_SUBTITULO_BLOQUE
+                        ),
+                        html.Div([
+                            html.A(
+                                "GitHub",
+                                href="https://github.com/",
+                                target="_blank",
+                                rel="noopener noreferrer",
+                                style={
+                                    **ESTILO_BTN_PRIMARIO,
+                                    'marginRight': '12px'
+                                }
+                            ),
+                            html.A(
+                                "LinkedIn",
+                                href="https://www.linkedin.com/",
+                                target="_blank",
+                                rel="noopener noreferrer",
+                                style=ESTILO_BTN_SECUNDARIO
+                            ),
+                            html.A(
+                                "Enviar Email",
+                                href="mailto:tu.email@ejemplo.com",
+                                style={
+                                    **ESTILO_BTN_PRIMARIO,
+                                    'marginRight': '0px'
+                                }
+                            )
+                        ], style={'display': 'flex', 'flexWrap': 'wrap', 'alignItems': 'center'})
+                    ])
+
+                ], style={
+                    'flex': '1',
+                    'minWidth': '300px',
+                    'paddingRight': '40px'
+                }),
+
+                # Columna derecha: Imagen/Ilustración
                 html.Div([
-                    html.Img(
-                        src='/assets/images/loty.svg',
-                        alt='Ilustración personal',
-                        style={
-                            'width': '100%',
-                            'maxWidth': '400px',
-                            'height': 'auto'
-                        }
-                    )
+                    html.Div([
+                        html.Img(
+                            src='/assets/images/loty.svg',
+                            alt='Ilustración personal',
+                            style={
+                                'width': '100%',
+                                'maxWidth': '400px',
+                                'height': 'auto'
+                            }
+                        )
+                    ], style={
+                        'display': 'flex',
+                        'justifyContent': 'center',
+                        'alignItems': 'center'
+                    })
                 ], style={
+                    'flex': '1',
+                    'minWidth': '300px',
                     'display': 'flex',
                     'justifyContent': 'center',
                     'alignItems': 'center'
                 })
+
             ], style={
-                'flex': '1',
-                'minWidth': '300px',
                 'display': 'flex',
-                'justifyContent': 'center',
-                'alignItems': 'center'
+                'flexWrap': 'wrap',
+                'gap': '40px',
+                'alignItems': 'center',
+                'justifyContent': 'space-between'
             })
-
         ], style={
-            'display': 'flex',
-            'flexWrap': 'wrap',
-            'gap': '40px',
-            'alignItems': 'center',
-            'justifyContent': 'space-between'
-        })
-    ], style={
-        'padding': '60px 40px',
-        'maxWidth': '1200px',
-        'margin': '0 auto'
-    }),
+            'padding': '60px 40px',
+            'maxWidth': '1200px',
+            'margin': '0 auto'
+        }),
 
-    # Sección de estadísticas/destacados
-    html.Div([
+        # Sección de estadísticas/destacados
         html.Div([
             html.Div([
-                html.Div([
-                    html.H3(
-                        "3+",
-                        style={
-                            'fontSize': '36px',
-                            'fontWeight': '700',
-                            'color': COLORES['primario'],
-                            'margin': '0px',
-                            'marginBottom': '8px'
-                        }
-                    ),
-                    html.P(
-                        "Años de Experiencia",
-                        style={
-                            'fontSize': '14px',
-                            'color': COLORES['texto_secundario'],
-                            'margin': '0px'
-                        }
-                    )
-                ], style={'textAlign': 'center'})
+                crear_tarjeta_destacada(*destacado) for destacado in DESTACADOS
             ], style={
-                'padding': '24px',
-                'backgroundColor': f"rgba(44, 90, 160, 0.08)",
-                'borderRadius': '8px',
-                'border': f"1px solid {COLORES['borde']}"
-            }),
+                'display': 'grid',
+                'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
+                'gap': '24px',
+                'maxWidth': '1200px',
+                'margin': '0 auto'
+            })
+        ], style={
+            'padding': '60px 40px',
+            'backgroundColor': COLORES['fondo_claro'],
+            'borderTop': f"1px solid {COLORES['borde']}",
+            'borderBottom': f"1px solid {COLORES['borde']}"
+        }),
 
+        # Sección de herramientas/stack
+        html.Div([
             html.Div([
-                html.Div([
-                    html.H3(
-                        "10+",
-                        style={
-                            'fontSize': '36px',
-                            'fontWeight': '700',
-                            'color': COLORES['primario'],
-                            'margin': '0px',
-                            'marginBottom': '8px'
-                        }
-                    ),
-                    html.P(
-                        "Proyectos Completados",
-                        style={
-                            'fontSize': '14px',
-                            'color': COLORES['texto_secundario'],
-                            'margin': '0px'
-                        }
-                    )
-                ], style={'textAlign': 'center'})
-            ], style={
-                'padding': '24px',
-                'backgroundColor': f"rgba(39, 174, 96, 0.08)",
-                'borderRadius': '8px',
-                'border': f"1px solid {COLORES['borde']}"
-            }),
+                html.H2(
+                    "Stack Tecnológico",
+                    style=ESTILO_TITULO_SECCION
+                ),
 
-            html.Div([
                 html.Div([
-                    html.H3(
-                        "100%",
-                        style={
-                            'fontSize': '36px',
-                            'fontWeight': '700',
-                            'color': COLORES['primario'],
-                            'margin': '0px',
-                            'marginBottom': '8px'
-                        }
-                    ),
-                    html.P(
-                        "Comprometido",
-                        style={
-                            'fontSize': '14px',
-                            'color': COLORES['texto_secundario'],
-                            'margin': '0px'
-                        }
-                    )
-                ], style={'textAlign': 'center'})
+                    crear_columna_stack(*columna) for columna in STACK
+                ], style={
+                    'display': 'flex',
+                    'flexWrap': 'wrap',
+                    'gap': '40px',
+                    'justifyContent': 'space-around'
+                })
             ], style={
-                'padding': '24px',
-                'backgroundColor': f"rgba(243, 156, 18, 0.08)",
-                'borderRadius': '8px',
-                'border': f"1px solid {COLORES['borde']}"
+                'maxWidth': '1000px',
+                'margin': '0 auto',
+                'padding': '60px 40px'
             })
-
         ], style={
-            'display': 'grid',
-            'gridTemplateColumns': 'repeat(auto-fit, minmax(200px, 1fr))',
-            'gap': '24px',
-            'maxWidth': '1200px',
-            'margin': '0 auto'
-        })
-    ], style={
-        'padding': '60px 40px',
-        'backgroundColor': COLORES['fondo_claro'],
-        'borderTop': f"1px solid {COLORES['borde']}",
-        'borderBottom': f"1px solid {COLORES['borde']}"
-    }),
-
-    # Sección de herramientas/stack
-    html.Div([
-        html.Div([
-            html.H2(
-                "Stack Tecnológico",
-                style={
-                    'fontSize': '32px',
-                    'fontWeight': '700',
-                    'color': COLORES['primario'],
-                    'marginBottom': '32px',
-                    'textAlign': 'center'
-                }
-            ),
+            'backgroundColor': COLORES['fondo_oscuro'],
+            'borderBottom': f"1px solid {COLORES['borde']}"
+        }),
 
+        # Sección CTA final
+        html.Div([
             html.Div([
-                # Backend
-                html.Div([
-                    html.H3(
-                        "Backend",
-                        style={
-                            'fontSize': '18px',
-                            'fontWeight': '600',
-                            'color': COLORES['primario'],
-                            'marginBottom': '16px'
-                        }
-                    ),
-                    html.Ul([
-                        html.Li("Python (NumPy, SciPy, Pandas)"),
-                        html.Li("FastAPI & Flask"),
-                        html.Li("PostgreSQL & MongoDB"),
-                        html.Li("Docker & Kubernetes")
-                    ], style={'paddingLeft': '20px', 'color': COLORES['texto_primario']})
-                ], style={'flex': '1', 'minWidth': '250px'}),
-
-                # Frontend
+                html.H2(
+                    "¿Listo para Colaborar?",
+                    style={**ESTILO_TITULO_SECCION, 'marginBottom': '16px'}
+                ),
+                html.P(
+                    "Tengo experiencia en proyectos complejos de modelado matemático, "
+                    "desarrollo de aplicaciones web y análisis de datos. "
+                    "Hagamos realidad tu próximo proyecto.",
+                    style={
+                        'fontSize': '16px',
+                        'color': COLORES['texto_secundario'],
+                        'textAlign': 'center',
+                        'marginBottom': '32px',
+                        'maxWidth': '600px',
+                        'margin': '0 auto 32px'
+                    }
+                ),
                 html.Div([
-                    html.H3(
-                        "Frontend",
+                    html.A(
+                        "Iniciar Proyecto",
+                        href="mailto:tu.email@ejemplo.com",
                         style={
-                            'fontSize': '18px',
-                            'fontWeight': '600',
-                            'color': COLORES['primario'],
-                            'marginBottom': '16px'
+                            **ESTILO_BTN_PRIMARIO,
+                            'padding': '14px 32px',
+                            'fontSize': '16px'
                         }
                     ),
-                    html.Ul([
-                        html.Li("React & TypeScript"),
-                        html.Li("Dash (Plotly)"),
-                        html.Li("HTML5 & CSS3"),
-                        html.Li("Responsive Design")
-                    ], style={'paddingLeft': '20px', 'color': COLORES['texto_primario']})
-                ], style={'flex': '1', 'minWidth': '250px'}),
-
-                # Modelado
-                html.Div([
-                    html.H3(
-                        "Modelado & IA",
+                    html.A(
+                        "Ver Portafolio",
+                        href="/portafolio",
                         style={
-                            'fontSize': '18px',
-                            'fontWeight': '600',
-                            'color': COLORES['primario'],
-                            'marginBottom': '16px'
+                            **ESTILO_BTN_SECUNDARIO,
+                            'padding': '14px 32px',
+                            'fontSize': '16px'
                         }
-                    ),
-                    html.Ul([
-                        html.Li("Ecuaciones Diferenciales"),
-                        html.Li("Simulaciones Numéricas"),
-                        html.Li("Integración con LLMs"),
-                        html.Li("Análisis Estadístico")
-                    ], style={'paddingLeft': '20px', 'color': COLORES['texto_primario']})
-                ], style={'flex': '1', 'minWidth': '250px'})
-
+                    )
+                ], style={'display': 'flex', 'justifyContent': 'center', 'flexWrap': 'wrap'})
             ], style={
-                'display': 'flex',
-                'flexWrap': 'wrap',
-                'gap': '40px',
-                'justifyContent': 'space-around'
+                'maxWidth': '800px',
+                'margin': '0 auto',
+                'padding': '60px 40px',
+                'textAlign': 'center'
             })
         ], style={
-            'maxWidth': '1000px',
-            'margin': '0 auto',
-            'padding': '60px 40px'
+            'backgroundColor': f"rgba(44, 90, 160, 0.05)",
+            'borderTop': f"1px solid {COLORES['borde']}"
         })
-    ], style={
-        'backgroundColor': COLORES['fondo_oscuro'],
-        'borderBottom': f"1px solid {COLORES['borde']}"
-    }),
 
-    # Sección CTA final
-    html.Div([
-        html.Div([
-            html.H2(
-                "¿Listo para Colaborar?",
-                style={
-                    'fontSize': '32px',
-                    'fontWeight': '700',
-                    'color': COLORES['primario'],
-                    'marginBottom': '16px',
-                    'textAlign': 'center'
-                }
-            ),
-            html.P(
-                "Tengo experiencia en proyectos complejos de modelado matemático, "
-                "desarrollo de aplicaciones web y análisis de datos. "
-                "Hagamos realidad tu próximo proyecto.",
-                style={
-                    'fontSize': '16px',
-                    'color': COLORES['texto_secundario'],
-                    'textAlign': 'center',
-                    'marginBottom': '32px',
-                    'maxWidth': '600px',
-                    'margin': '0 auto 32px'
-                }
-            ),
-            html.Div([
-                html.A(
-                    "Iniciar Proyecto",
-                    href="mailto:tu.email@ejemplo.com",
-                    style={
-                        **ESTILO_BTN_PRIMARIO,
-                        'padding': '14px 32px',
-                        'fontSize': '16px'
-                    }
-                ),
-                html.A(
-                    "Ver Portafolio",
-                    href="/portafolio",
-                    style={
-                        **ESTILO_BTN_SECUNDARIO,
-                        'padding': '14px 32px',
-                        'fontSize': '16px'
-                    }
-                )
-            ], style={'display': 'flex', 'justifyContent': 'center', 'flexWrap': 'wrap'})
-        ], style={
-            'maxWidth': '800px',
-            'margin': '0 auto',
-            'padding': '60px 40px',
-            'textAlign': 'center'
-        })
     ], style={
-        'backgroundColor': f"rgba(44, 90, 160, 0.05)",
-        'borderTop': f"1px solid {COLORES['borde']}"
+        'padding': '0px',
+        'backgroundColor': COLORES['fondo_oscuro'],
+        'fontFamily': 'Segoe UI, Arial, sans-serif',
+        'minHeight': '100vh'
     })
-
-], style={
-    'padding': '0px',
-    'backgroundColor': COLORES['fondo_oscuro'],
-    'fontFamily': 'Segoe UI, Arial, sans-serif',
-    'minHeight': '100vh'
-})
\ No newline at end of file